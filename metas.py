@@ -1,6 +1,10 @@
+import os
+
+import matplotlib
+matplotlib.use("Agg")  # gera só ficheiros, sem janela
 import matplotlib.pyplot as plt
 import numpy as np
-from pulp import LpProblem, LpMinimize, LpVariable, lpSum, value, LpStatus
+from pulp import LpProblem, LpMinimize, LpVariable, LpAffineExpression, LpStatus, PULP_CBC_CMD
 
 # -----------------------------------
 # 1) Definição do Problema (Metas)
@@ -19,6 +23,8 @@ custo = {
     ("A1","CD1"): 3.0,  ("A1","CD2"): 4.0,  ("A1","CD3"): 3.5,
     ("A2","CD1"): 5.5,  ("A2","CD2"): 3.5, ("A2","CD3"): 4.5
 }
+# ... e a mesma tabela como matriz (linha = armazém, coluna = centro)
+C = np.array([[custo[(i,j)] for j in centros] for i in armazens], dtype=np.float64)
 
 # Metas:
 #   1) Custo total ≤ 2500
@@ -35,104 +41,114 @@ d1_plus  = LpVariable("d1_plus",  lowBound=0)
 d2_minus = LpVariable("d2_minus", lowBound=0)
 d2_plus  = LpVariable("d2_plus",  lowBound=0)
 
-# Expressão de custo
-cost_expr = lpSum(custo[(i,j)] * x[(i,j)] for i in armazens for j in centros)
+# Expressões de custo e de expedição de A2, construídas uma só vez e
+# reutilizadas nas restrições e na leitura da solução
+cost_expr = LpAffineExpression((x[(i,j)], C[ia,ic])
+                               for ia, i in enumerate(armazens) for ic, j in enumerate(centros))
+expA2_expr = LpAffineExpression((x[("A2",j)], 1) for j in centros)
 
 # Meta 1: cost_expr + d1_minus - d1_plus = 2500
 model += cost_expr + d1_minus - d1_plus == 2500, "MetaCusto"
 
 # Meta 2: sum(A2->CDs) + d2_minus - d2_plus = 300
-model += lpSum(x[("A2",j)] for j in centros) + d2_minus - d2_plus == 300, "MetaA2"
+model += expA2_expr + d2_minus - d2_plus == 300, "MetaA2"
 
 # Restrições de oferta e procura
-model += lpSum(x[("A1",j)] for j in centros) <= oferta["A1"], "CapA1"
-model += lpSum(x[("A2",j)] for j in centros) <= oferta["A2"], "CapA2"
+model += LpAffineExpression((x[("A1",j)], 1) for j in centros) <= oferta["A1"], "CapA1"
+model += expA2_expr <= oferta["A2"], "CapA2"
 for c in centros:
-    model += lpSum(x[(i,c)] for i in armazens) == procura[c], f"Proc_{c}"
+    model += LpAffineExpression((x[(i,c)], 1) for i in armazens) == procura[c], f"Proc_{c}"
 
 # Função objetivo: penalizar exceder ou ficar aquém da meta de A2
 # e também penalizar ultrapassar a meta de custo
 w1, w2 = 1, 1
 model += w1*d1_plus + w2*d2_minus, "ObjMetas"
 
-model.solve()
-
-print("\n===> SOLUÇÃO ÓTIMA PARA PROGRAMAÇÃO POR METAS <===")
-print("Status:", LpStatus[model.status])
-custo_total = value(cost_expr)
-expA2 = value(lpSum(x[("A2",j)] for j in centros))
-print(f"Custo Total: {custo_total:.2f} €")
-print(f"Expedição de A2: {expA2:.0f} caixas")
-print(f"Pesos: w1 = {w1}, w2 = {w2}")
-
-# Extrair quantidades para cada centro
-distA1 = [value(x[("A1",cd)]) for cd in centros]
-distA2 = [value(x[("A2",cd)]) for cd in centros]
-
-# ---------------------------------------
-# 2) Figura 4: gráfico de barras empilhadas
-# ---------------------------------------
-plt.figure(figsize=(8, 5))
-indices = np.arange(len(centros))
-plt.bar(indices, distA1, color='orange', label="A1")
-plt.bar(indices, distA2, bottom=distA1, color='blue', label="A2")
-plt.xticks(indices, centros, fontsize=10)
-plt.xlabel("Centros de Distribuição", fontsize=10)
-plt.ylabel("Quantidade de Caixas", fontsize=10)
-plt.title("Figura 4: Distribuição das Caixas (A1 vs. A2) por Centro", fontsize=12)
-plt.legend()
-plt.grid(axis='y', linestyle='--', alpha=0.7)
-plt.tight_layout()
-plt.savefig("Figura4.png", dpi=300)
-plt.close()
-
-# --------------------------------------
-# 3) Figura 5: gráfico de linha + marcadores
-# --------------------------------------
-w2_values = np.linspace(0, 5, 6)  # [0,1,2,3,4,5]
-expA2_list = []
-
-for w2test in w2_values:
-    m2 = LpProblem("ProgMetas_sens", LpMinimize)
-    x2 = {(i,j): LpVariable(f"x_{i}_{j}", lowBound=0) for i in armazens for j in centros}
-    d1m = LpVariable("d1_minus", lowBound=0)
-    d1p = LpVariable("d1_plus",  lowBound=0)
-    d2m = LpVariable("d2_minus", lowBound=0)
-    d2p = LpVariable("d2_plus",  lowBound=0)
-    
-    cost_expr2 = lpSum(custo[(i,j)] * x2[(i,j)] for i in armazens for j in centros)
-    # Meta 1
-    m2 += cost_expr2 + d1m - d1p == 2500
-    # Meta 2
-    m2 += lpSum(x2[("A2",cd)] for cd in centros) + d2m - d2p == 300
-
-    m2 += lpSum(x2[("A1",cd)] for cd in centros) <= oferta["A1"]
-    m2 += lpSum(x2[("A2",cd)] for cd in centros) <= oferta["A2"]
-    for c in centros:
-        m2 += lpSum(x2[(i,c)] for i in armazens) == procura[c]
-
-    # função objetivo penaliza d1p e (d2m + d2p)
-    m2 += 1 * d1p + w2test * d2m
-    m2.solve()
-
-    expA2_sens = value(lpSum(x2[("A2",cd)] for cd in centros))
-    expA2_list.append(expA2_sens)
-
-plt.figure(figsize=(8, 5))
-plt.plot(w2_values, expA2_list, marker='o', linestyle='--', color='purple', linewidth=2)
-
-plt.title("Figura 5: Variação de w₂ e Impacto na Expedição de A2", fontsize=12)
-plt.xlabel("Peso w₂ (importância da meta de A2)", fontsize=10)
-plt.ylabel("Expedição de A2 (caixas)", fontsize=10)
-
-y_min = min(expA2_list) - 10
-y_max = max(expA2_list) + 10
-plt.ylim([y_min, y_max])
-
-plt.grid(True, linestyle='--', alpha=0.7)
-plt.tight_layout()
-plt.savefig("Figura5.png", dpi=300)
-plt.close()
-
-print("\n[OK] Geradas as figuras: 'Figura4.png' e 'Figura5.png'.")
-print("Fim do script metas.py\n")
+# Sempre o CBC (o solver incluído no PuLP): o modelo de metas tem muitas
+# soluções ótimas alternativas e outro solver devolveria outro vértice, o
+# que mudaria os valores do relatório (Figuras 4 e 5)
+solver = PULP_CBC_CMD(msg=0, keepFiles=False, threads=1, timeLimit=10)
+
+
+def solve_one(w2test):
+    """Expedição de A2 na solução ótima com peso w2 = w2test."""
+    model.objective[d2_minus] = w2test
+    model.solve(solver)
+    return expA2_expr.value()
+
+
+def solve_metas():
+    """Resolve o modelo de metas, gera as Figuras 4 e 5 e devolve (dist, expA2_list)."""
+    # Repor o peso original (a análise de sensibilidade altera-o)
+    model.objective[d2_minus] = w2
+    model.solve(solver)
+
+    print("\n===> SOLUÇÃO ÓTIMA PARA PROGRAMAÇÃO POR METAS <===")
+    print("Status:", LpStatus[model.status])
+    custo_total = cost_expr.value()
+    expA2 = expA2_expr.value()
+    print(f"Custo Total: {custo_total:.2f} €")
+    print(f"Expedição de A2: {expA2:.0f} caixas")
+    print(f"Pesos: w1 = {w1}, w2 = {w2}")
+
+    # Extrair quantidades para cada centro (linha = armazém, coluna = centro)
+    dist = np.fromiter((x[(i,cd)].varValue for i in armazens for cd in centros),
+                       dtype=np.float64, count=len(armazens)*len(centros))
+    dist = dist.reshape(len(armazens), len(centros))
+
+    # Sensibilidade ao peso w2 (dados da Figura 5)
+    w2_values = np.linspace(0, 5, 6)  # [0,1,2,3,4,5]
+
+    expA2_list = np.empty(len(w2_values))
+    for k, w2test in enumerate(w2_values):
+        expA2_list[k] = solve_one(w2test)
+
+    # A partir daqui só se desenham e gravam as figuras;
+    # só com SKIP_PLOTS=1 (benchmarks, CI) não se gera nenhuma
+    if os.environ.get("SKIP_PLOTS") != "1":
+        # ---------------------------------------
+        # 2) Figura 4: gráfico de barras empilhadas
+        # ---------------------------------------
+        # As Figuras 4 e 5 partilham a mesma figura/eixos
+        fig, ax = plt.subplots(figsize=(8, 5))
+        indices = np.arange(len(centros))
+        ax.bar(indices, dist[0], color='orange', label="A1")
+        ax.bar(indices, dist[1], bottom=dist[0], color='blue', label="A2")
+        ax.set_xticks(indices, centros, fontsize=10)
+        ax.set_xlabel("Centros de Distribuição", fontsize=10)
+        ax.set_ylabel("Quantidade de Caixas", fontsize=10)
+        ax.set_title("Figura 4: Distribuição das Caixas (A1 vs. A2) por Centro", fontsize=12)
+        ax.legend()
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+        fig.tight_layout()
+        fig.savefig("Figura4.png", dpi=300)
+
+        # --------------------------------------
+        # 3) Figura 5: gráfico de linha + marcadores
+        # --------------------------------------
+        # Eixos novos: ax.clear() não repõe o estilo da grelha da Figura 4
+        fig.clf()
+        ax = fig.add_subplot()
+        ax.plot(w2_values, expA2_list, marker='o', linestyle='--', color='purple', linewidth=2)
+
+        ax.set_title("Figura 5: Variação de w₂ e Impacto na Expedição de A2", fontsize=12)
+        ax.set_xlabel("Peso w₂ (importância da meta de A2)", fontsize=10)
+        ax.set_ylabel("Expedição de A2 (caixas)", fontsize=10)
+
+        y_min = expA2_list.min() - 10
+        y_max = expA2_list.max() + 10
+        ax.set_ylim([y_min, y_max])
+
+        ax.grid(True, linestyle='--', alpha=0.7)
+        fig.tight_layout()
+        fig.savefig("Figura5.png", dpi=300)
+        plt.close(fig)
+
+        print("\n[OK] Geradas as figuras: 'Figura4.png' e 'Figura5.png'.")
+    print("Fim do script metas.py\n")
+
+    return dist, expA2_list
+
+
+if __name__ == "__main__":
+    solve_metas()
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+import transporte
+
+
+def avaliar(retas, custos):
+    return np.min([z0 + q*(custos - c0) for c0, z0, q in retas], axis=0)
+
+
+def custo_otimo_lp(oferta, cvar):
+    """Custo ótimo do problema de transporte por LP (referência independente)."""
+    C = transporte.C.copy()
+    C[transporte.armazens.index("A2"), transporte.centros.index("CD3")] = cvar
+    n_a, n_c = C.shape
+    A_ub = np.kron(np.eye(n_a), np.ones(n_c))
+    A_eq = np.kron(np.ones(n_a), np.eye(n_c))
+    res = linprog(C.ravel(), A_ub=A_ub, b_ub=[oferta[i] for i in transporte.armazens],
+                  A_eq=A_eq, b_eq=[transporte.procura[j] for j in transporte.centros],
+                  method="highs")
+    return res.fun
+
+
+@pytest.fixture
+def grafo(monkeypatch):
+    """Garante que a capacidade de A1 é reposta no fim de cada teste."""
+    monkeypatch.setitem(transporte.G["origem"]["A1"], "capacity", transporte.oferta["A1"])
+    return transporte.G
+
+
+def test_curva_figura1(grafo):
+    custos = np.linspace(3.0, 8.0, 11)
+    retas = transporte.curva_parametrica(custos[0], custos[-1])
+    np.testing.assert_allclose(avaliar(retas, custos), [2225.0] + [2350.0]*10)
+    assert grafo["A2"]["CD3"]["weight"] == 450  # peso original reposto
+
+
+def test_curva_com_varios_troços(grafo):
+    # Com A1 limitado a 420 caixas a curva tem três troços, com uma
+    # interseção fora dos múltiplos de 0.5 €
+    grafo["origem"]["A1"]["capacity"] = 420
+    oferta = dict(transporte.oferta, A1=420)
+
+    retas = transporte.curva_parametrica(3.0, 8.0)
+    assert len({q for _, _, q in retas}) == 3
+
+    custos = np.round(np.arange(300, 801) / 100, 2)
+    esperado = [custo_otimo_lp(oferta, c) for c in custos]
+    np.testing.assert_allclose(avaliar(retas, custos), esperado)
@@ -1,7 +1,13 @@
 # transporte.py
+import math
+import os
+from fractions import Fraction
+
+import matplotlib
+matplotlib.use("Agg")  # apenas se gravam ficheiros PNG
 import matplotlib.pyplot as plt
 import numpy as np
-from pulp import LpProblem, LpMinimize, LpVariable, lpSum, value, LpStatus
+import networkx as nx
 
 # -------------------------
 # 1) Definição do Problema
@@ -15,97 +21,150 @@ custo_inicial = {
     ("A2","CD1"): 5.5,  ("A2","CD2"): 3.5, ("A2","CD3"): 4.5
 }
 
-# Criar modelo
-model = LpProblem("Transporte_Adega", LpMinimize)
-
-# Variáveis de decisão x[i][j] = quantidade enviada do armazém i ao centro j
-x = {(i,j): LpVariable(f"x_{i}_{j}", lowBound=0, cat="Continuous")
-     for i in armazens for j in centros}
-
-# Função objetivo: minimizar custo total
-model += lpSum(custo_inicial[(i,j)] * x[(i,j)] for i in armazens for j in centros), "Custo_Total"
+# Matriz de custos indexada por inteiros: linha = armazém, coluna = centro
+C = np.array([[custo_inicial[(i,j)] for j in centros] for i in armazens], dtype=np.float64)
 
-# Restrições de oferta
-for i in armazens:
-    model += lpSum(x[(i,j)] for j in centros) <= oferta[i], f"Oferta_{i}"
+# O network simplex só é fiável com pesos inteiros: os custos entram no
+# grafo em cêntimos e o custo total é convertido de volta para euros
+ESCALA = 100
 
-# Restrições de procura
-for j in centros:
-    model += lpSum(x[(i,j)] for i in armazens) == procura[j], f"Procura_{j}"
 
-# Resolver
-model.solve()
+def em_centimos(custo):
+    """Custo em euros convertido no peso inteiro (cêntimos) usado no grafo."""
+    return int(round(ESCALA*custo))
 
-print("\n===> SOLUÇÃO ÓTIMA PARA O PROBLEMA DE TRANSPORTE <===")
-print("Status:", LpStatus[model.status])
-print(f"Custo Total de Transporte: {value(model.objective):.2f} €")
 
-# Extrair solução para Tabela 1
-solucao = []
+# Problema de transporte como fluxo de custo mínimo, resolvido pelo
+# network simplex: origem -> armazém i (capacidade = oferta[i]) -> centro j
+G = nx.DiGraph()
+G.add_node("origem", demand=-sum(procura.values()))
 for i in armazens:
-    for j in centros:
-        q = value(x[(i,j)])
-        if q > 0:
-            custo_unit = custo_inicial[(i,j)]
-            solucao.append((i, j, q, custo_unit, q*custo_unit))
-
-# Imprimir Tabela 1 em texto
-print("\nTABELA 1: Quantidades e Custos")
-print(f"{'Armazém':<6} {'Centro':<4} {'Qtd':>8} {'CustoUnit':>10} {'CustoTotal':>12}")
-for row in solucao:
-    print(f"{row[0]:<6} {row[1]:<5} {row[2]:8.0f} {row[3]:10.2f} {row[4]:12.2f}")
-
-# Gerar Tabela 1 como figura (opcional)
-fig, ax = plt.subplots(figsize=(6,2))
-ax.axis('off')
-col_labels = ["Armazém", "Centro Dist.", "Qtd (caixas)", "Custo Unit.", "Custo Total"]
-table_data = []
-for (i, j, qtd, cunit, ctotal) in solucao:
-    table_data.append([i, j, f"{qtd:.0f}", f"{cunit:.2f}", f"{ctotal:.2f}"])
-
-the_table = ax.table(cellText=table_data, colLabels=col_labels, loc='center')
-the_table.auto_set_font_size(False)
-the_table.set_fontsize(9)
-the_table.scale(1.2, 1.2)
-plt.savefig("Tabela1.png", dpi=300, bbox_inches='tight')
-plt.close()
-
-# ------------------------------------------------------
-# 2) Análise de Sensibilidade: Figura 1 (gráfico de linhas)
-# ------------------------------------------------------
-# Vamos variar o custo de A2->CD3 de 4.0 até 6.0, e ver o impacto no custo total
-
-custos_variados = np.linspace(3.0, 8.0, 11)  # [4.0, 4.4, 4.8, 5.2, 5.6, 6.0]
-custo_total_lista = []
-
-for cvar in custos_variados:
-    # Criar novo modelo para cada cenário
-    model_sens = LpProblem("Transporte_Sens", LpMinimize)
-    x_sens = {(i,j): LpVariable(f"x_{i}_{j}", lowBound=0, cat="Continuous")
-              for i in armazens for j in centros}
-    
-    # Atualizar custo de A2->CD3
-    custo_atual = dict(custo_inicial)
-    custo_atual[("A2","CD3")] = cvar
-    
-    model_sens += lpSum(custo_atual[(i,j)] * x_sens[(i,j)] for i in armazens for j in centros), "Custo_Total"
-    for i in armazens:
-        model_sens += lpSum(x_sens[(i,j)] for j in centros) <= oferta[i]
-    for j in centros:
-        model_sens += lpSum(x_sens[(i,j)] for i in armazens) == procura[j]
-    
-    model_sens.solve()
-    custo_total_lista.append(value(model_sens.objective))
-
-# Figura 1: gráfico de linhas (custo total vs. custo A2->CD3)
-plt.figure(figsize=(6,4))
-plt.plot(custos_variados, custo_total_lista, marker='o')
-plt.title("Figura 1: Impacto de variações no custo A2→CD3 no Custo Total")
-plt.xlabel("Custo A2→CD3 (€/caixa)")
-plt.ylabel("Custo Total de Transporte (€)")
-plt.grid(True)
-plt.savefig("Figura1.png", dpi=300, bbox_inches='tight')
-plt.close()
-
-print("\n[OK] Geradas as figuras: 'Tabela1.png' (com a solução) e 'Figura1.png' (sensibilidade).")
-print("Fim do script transporte.py\n")
\ No newline at end of file
+    G.add_edge("origem", i, capacity=oferta[i], weight=0)
+for j in centros:
+    G.add_node(j, demand=procura[j])
+
+# Arcos armazém -> centro, sem limite de capacidade; weight = custo unitário (cêntimos)
+for ia, i in enumerate(armazens):
+    for ic, j in enumerate(centros):
+        G.add_edge(i, j, weight=em_centimos(C[ia,ic]))
+
+
+def curva_parametrica(c_min, c_max):
+    """Retas (c0, z0, q) cujo mínimo é o custo ótimo z(c) em [c_min, c_max].
+
+    z(c) é côncava e linear por troços: a solução ótima em c0, com q caixas
+    em A2->CD3, dá a reta z0 + q*(c - c0), e z(c) é o mínimo destas retas.
+    Resolve-se nos extremos e, recursivamente, entre retas vizinhas até
+    todas as interseções estarem sobre a curva. Tudo é feito em cêntimos
+    inteiros, para o network simplex nunca receber um peso fracionário; as
+    retas são exatas em qualquer custo com precisão ao cêntimo.
+    """
+    def reta(n):
+        G["A2"]["CD3"]["weight"] = n
+        z, fluxo = nx.network_simplex(G)
+        return n, z, fluxo["A2"]["CD3"]
+
+    def entre(ra, rb):
+        (a, za, qa), (b, zb, qb) = ra, rb
+        if qa == qb or b - a <= 1:
+            return [ra, rb]  # nenhum cêntimo interior fica por cobrir
+        c = Fraction(zb - za + qa*a - qb*b, qa - qb)  # interseção exata
+        if c.denominator == 1:
+            rc = reta(int(c))
+            if rc[1] == za + qa*(int(c) - a):
+                return [ra, rb]  # ponto de quebra: as duas retas chegam
+        else:
+            # Interseção fora dos cêntimos: pode ser o ponto de quebra
+            # (Δz/Δq raramente é um número inteiro de cêntimos) ou pode
+            # haver outro troço pelo meio; resolver num cêntimo
+            # estritamente interior decide entre os dois casos
+            rc = reta(min(max(math.floor(c), a + 1), b - 1))
+        return entre(ra, rc) + entre(rc, rb)
+
+    peso = G["A2"]["CD3"]["weight"]
+    try:
+        retas = entre(reta(em_centimos(c_min)), reta(em_centimos(c_max)))
+    finally:
+        G["A2"]["CD3"]["weight"] = peso  # o grafo fica como estava
+    return [(n / ESCALA, z / ESCALA, q) for n, z, q in retas]
+
+
+def solve_transporte():
+    """Resolve o transporte, gera a Tabela 1 e a Figura 1.
+
+    Devolve (solucao, custo_total_lista).
+    """
+    # Resolver (fluxo[i][j] = quantidade enviada do armazém i ao centro j)
+    custo_total, fluxo = nx.network_simplex(G)
+    custo_total /= ESCALA
+
+    print("\n===> SOLUÇÃO ÓTIMA PARA O PROBLEMA DE TRANSPORTE <===")
+    print(f"Custo Total de Transporte: {custo_total:.2f} €")
+
+    # Extrair solução para Tabela 1
+    solucao = []
+    for ia, i in enumerate(armazens):
+        for ic, j in enumerate(centros):
+            q = fluxo[i][j]
+            if q > 0:
+                custo_unit = C[ia,ic]
+                solucao.append((i, j, q, custo_unit, q*custo_unit))
+
+    # Imprimir Tabela 1 em texto
+    print("\nTABELA 1: Quantidades e Custos")
+    print(f"{'Armazém':<6} {'Centro':<4} {'Qtd':>8} {'CustoUnit':>10} {'CustoTotal':>12}")
+    for row in solucao:
+        print(f"{row[0]:<6} {row[1]:<5} {row[2]:8.0f} {row[3]:10.2f} {row[4]:12.2f}")
+
+    # ------------------------------------------------------
+    # 2) Análise de Sensibilidade (dados da Figura 1)
+    # ------------------------------------------------------
+    # Vamos variar o custo de A2->CD3 de 3.0 até 8.0, e ver o impacto no custo total
+
+    custos_variados = np.linspace(3.0, 8.0, 11)  # [3.0, 3.5, ..., 8.0]
+    # Em vez de resolver em cada ponto, obter os troços lineares de z(c)
+    # (aqui 3 resoluções em vez de 11) e avaliar a curva em todos os pontos
+    retas = curva_parametrica(custos_variados[0], custos_variados[-1])
+    custo_total_lista = np.min([z0 + q*(custos_variados - c0) for c0, z0, q in retas], axis=0)
+
+    # Todos os dados estão calculados; seguem-se as figuras;
+    # só com SKIP_PLOTS=1 (benchmarks, CI) não se gera nenhuma
+    if os.environ.get("SKIP_PLOTS") != "1":
+        # Gerar Tabela 1 como figura (opcional); a mesma figura serve depois
+        # para a Figura 1
+        fig, ax = plt.subplots(figsize=(6,2))
+        ax.axis('off')
+        col_labels = ["Armazém", "Centro Dist.", "Qtd (caixas)", "Custo Unit.", "Custo Total"]
+        table_data = []
+        for (i, j, qtd, cunit, ctotal) in solucao:
+            table_data.append([i, j, f"{qtd:.0f}", f"{cunit:.2f}", f"{ctotal:.2f}"])
+
+        the_table = ax.table(cellText=table_data, colLabels=col_labels, loc='center')
+        the_table.auto_set_font_size(False)
+        the_table.set_fontsize(9)
+        the_table.scale(1.2, 1.2)
+        fig.savefig("Tabela1.png", dpi=300, bbox_inches='tight')
+
+        # ------------------------------------------------------
+        # Figura 1: gráfico de linhas (custo total vs. custo A2->CD3)
+        # ------------------------------------------------------
+        # Eixos novos (fig.clf), para nada da tabela passar para o gráfico
+        fig.clf()
+        fig.set_size_inches(6, 4)
+        ax = fig.add_subplot()
+        ax.plot(custos_variados, custo_total_lista, marker='o')
+        ax.set_title("Figura 1: Impacto de variações no custo A2→CD3 no Custo Total")
+        ax.set_xlabel("Custo A2→CD3 (€/caixa)")
+        ax.set_ylabel("Custo Total de Transporte (€)")
+        ax.grid(True)
+        fig.savefig("Figura1.png", dpi=300, bbox_inches='tight')
+        plt.close(fig)
+
+        print("\n[OK] Geradas as figuras: 'Tabela1.png' (com a solução) e 'Figura1.png' (sensibilidade).")
+    print("Fim do script transporte.py\n")
+
+    return solucao, custo_total_lista
+
+
+if __name__ == "__main__":
+    solve_transporte()